@@ -11,6 +11,8 @@ Run examples:
   python open_aiche_annotated.py --selenium edge
   python open_aiche_annotated.py --selenium firefox
   python open_aiche_annotated.py --selenium chrome --headless
+  python open_aiche_annotated.py --selenium chrome --remote
+  python open_aiche_annotated.py --selenium chrome,edge,firefox --headless
 
 Dependencies for Selenium mode:
   pip install selenium webdriver-manager
@@ -18,20 +20,74 @@ Dependencies for Selenium mode:
 Notes:
 - This file is intentionally verbose with comments, explaining each line and choice.
 - The canonical AIChE domain is .org; .com typically redirects.
+- --remote keeps chromedriver and its browser session alive between runs and reattaches to
+  them, skipping the browser cold start on every run after the first.
 """
 
 # -------------------------
 # Standard library imports
 # -------------------------
 import argparse          # Build a friendly command-line interface (CLI).
+import json              # Persist the reusable driver's URL + session id between runs.
+import os                # Path joins for the driver state file.
+import re                # Pull the major version out of "Google Chrome 126.0.6478.126".
+import shutil            # Delete a temporary fallback profile once its browser has quit.
+import socket            # Check whether the persistent chromedriver is already listening.
+import subprocess        # Start chromedriver as a detached, long-lived process.
 import sys               # For sys.stderr (error output) and sys.exit (exit codes).
+import tempfile          # Portable location for the driver state file.
+import threading         # Guard the driver-path cache file when browsers launch in parallel.
 import time              # For sleep() to keep a visible browser open briefly.
 import webbrowser        # Lightweight way to open URLs in the user's default browser.
+# Run several Selenium browsers concurrently (one thread per browser/driver).
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import fcntl         # POSIX only: probe Firefox's .parentlock without taking it over.
+except ImportError:
+    fcntl = None
 
 # ---------------------------------------------
 # Configuration: keep key values in one place.
 # ---------------------------------------------
 URL = "https://www.aiche.org"  # Canonical AIChE domain; servers may redirect .com -> .org.
+REMOTE_PORT = 9515             # Port the persistent chromedriver listens on (--remote mode).
+# Where --remote mode remembers the driver URL and session id between invocations.
+REMOTE_STATE_FILE = os.path.join(tempfile.gettempdir(), "aiche_driver.json")
+# Persistent per-browser profiles: disk cache and startup caches survive between runs.
+PROFILE_ROOT = os.path.expanduser("~/.cache")
+# Chromium (Chrome/Edge) headless flags: each one skips a subsystem's startup work
+# (GPU, extensions, sync, safe-browsing downloads, ...), cutting cold-start time and RSS.
+CHROMIUM_HEADLESS_FLAGS = (
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+    "--metrics-recording-only",
+)
+# Remembers which driver binary matched which browser major version, so warm runs can skip
+# webdriver-manager's network version check entirely.
+DRIVER_CACHE_FILE = os.path.join(PROFILE_ROOT, "aiche_driver_paths.json")
+_driver_cache_lock = threading.Lock()
+# webdriver-manager reads and rewrites its shared ~/.wdm cache without locking, so parallel
+# browser launches must run install() one at a time; only startup/navigation run concurrently.
+_wdm_install_lock = threading.Lock()
+# Where to look for each browser's executable when asking it for its version.
+BROWSER_BINARIES = {
+    "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+               "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+    "edge": ("microsoft-edge", "microsoft-edge-stable",
+             "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"),
+    "firefox": ("firefox", "/Applications/Firefox.app/Contents/MacOS/firefox"),
+}
 
 def open_with_webbrowser():
     """
@@ -50,10 +106,237 @@ def open_with_webbrowser():
         # Exit code 1 signals a general failure for this mode.
         sys.exit(1)
 
-def open_with_selenium(browser: str, headless: bool):
+def _cdp_navigate(driver, url: str, timeout: float = 20) -> bool:
+    """
+    Navigate a Chromium driver via the DevTools Protocol and return as soon as the page's
+    load event fires (read from the "performance" log), instead of polling the DOM.
+
+    Returns False without navigating if the driver has no CDP support (Firefox, or a
+    plain webdriver.Remote in --remote mode); the caller then uses driver.get + a wait.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        driver.get_log("performance")              # Drain events buffered during startup.
+    except Exception:
+        return False                               # Performance logging not enabled.
+    driver.execute_cdp_cmd("Page.enable", {})
+    driver.execute_cdp_cmd("Page.navigate", {"url": url})
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for entry in driver.get_log("performance"):
+            if json.loads(entry["message"])["message"].get("method") == "Page.loadEventFired":
+                return True
+        time.sleep(0.05)
+    # Timed out; continue anyway—network blockers or cookie modals can interfere.
+    return True
+
+def _browser_major_version(browser: str):
+    """Return the installed browser's major version (e.g. "126"), or None if not found."""
+    for binary in BROWSER_BINARIES.get(browser, ()):
+        try:
+            out = subprocess.run([binary, "--version"], capture_output=True,
+                                 text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue  # Not installed under this name/path; try the next candidate.
+        match = re.search(r"(\d+)\.\d+", out)
+        if match:
+            return match.group(1)
+    return None  # Unknown (e.g. Windows, where --version prints nothing): no memoization.
+
+def _driver_path(browser: str, install) -> str:
+    """
+    Return the driver binary for `browser`, calling `install` (webdriver-manager) only when
+    the cached path is missing or was recorded for a different browser major version.
+    """
+    major = _browser_major_version(browser)
+    try:
+        with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            entry = json.load(f).get(browser)
+    except (OSError, ValueError):
+        entry = None
+    if major and entry and entry.get("major") == major and os.path.isfile(entry.get("path", "")):
+        return entry["path"]  # Warm cache: no network round-trip.
+
+    with _wdm_install_lock:
+        path = install()
+    if major:
+        # Re-read under the lock so parallel launches don't drop each other's entries.
+        with _driver_cache_lock:
+            try:
+                with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            cache[browser] = {"major": major, "path": path}
+            os.makedirs(PROFILE_ROOT, exist_ok=True)
+            with open(DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+    return path
+
+def _pid_alive(pid: int) -> bool:
+    """Return True if a process with this pid exists (POSIX signal-0 probe)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True   # Exists but belongs to someone else (or we can't tell): assume alive.
+    return True
+
+def _is_browser_process(pid: int) -> bool:
+    """
+    Return True if `pid` is a running browser. Guards against a stale lock whose pid has
+    been reused by an unrelated process. Where /proc isn't available (macOS) we can only
+    check that the pid is alive.
+    """
+    if not _pid_alive(pid):
+        return False
+    try:
+        with open(f"/proc/{pid}/comm", "r", encoding="utf-8") as f:
+            name = f.read().strip().lower()
+    except OSError:
+        return True
+    return any(b in name for b in ("chrome", "chromium", "msedge", "firefox"))
+
+def _profile_locked(path: str) -> bool:
+    """
+    Return True if a running browser currently owns the profile directory at `path`.
+
+    Chromium leaves a "SingletonLock" symlink -> "<host>-<pid>" (POSIX) or holds "lockfile"
+    open (Windows). Firefox leaves a "lock" symlink -> "<ip>:+<pid>" (Linux), holds
+    "parent.lock" open (Windows), and fcntl-locks ".parentlock" (macOS/Linux).
+    Stale leftovers from a crashed browser don't count as locked.
+    """
+    singleton = os.path.join(path, "SingletonLock")
+    if os.path.islink(singleton):
+        # Like Chromium: a lock from another host (shared home dir) can't be checked, so it
+        # counts as held; on this host it's held only if that pid is still a browser.
+        host, _, pid = os.readlink(singleton).rpartition("-")
+        if host != socket.gethostname() or (pid.isdigit() and _is_browser_process(int(pid))):
+            return True
+    firefox_link = os.path.join(path, "lock")
+    if os.path.islink(firefox_link):
+        pid = re.search(r"(\d+)$", os.readlink(firefox_link))
+        if pid and _is_browser_process(int(pid.group(1))):
+            return True
+    for name in ("lockfile", "parent.lock"):
+        lock_file = os.path.join(path, name)
+        if os.path.isfile(lock_file):
+            try:
+                open(lock_file, "a").close()   # Windows refuses while the browser holds it.
+            except PermissionError:
+                return True
+    parent_lock = os.path.join(path, ".parentlock")
+    if fcntl is not None and os.path.isfile(parent_lock):
+        with open(parent_lock, "a") as f:
+            try:
+                fcntl.lockf(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.lockf(f, fcntl.LOCK_UN)
+            except OSError:
+                return True
+    return False
+
+def _profile_dir(browser: str):
     """
-    Launch a real browser controlled by Selenium WebDriver. Supports Chrome, Edge, and Firefox.
+    Return (path, is_temporary) for a browser's cached profile, creating it on first run.
+    If another browser process is using it (e.g. a concurrent run), return a fresh
+    temporary profile instead so this launch doesn't fail with "already in use";
+    the caller deletes that one once its browser has quit.
+    """
+    path = os.path.join(PROFILE_ROOT, f"aiche_{browser}_profile")
+    os.makedirs(path, exist_ok=True)
+    if _profile_locked(path):
+        print(f"Profile {path} is in use; using a temporary profile for this run.")
+        return tempfile.mkdtemp(prefix=f"aiche_{browser}_profile_"), True
+    return path, False
+
+def _port_open(port: int) -> bool:
+    """Return True if something is accepting TCP connections on localhost:port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+def _remote_chrome(webdriver, options, driver_path_factory, headless: bool):
+    """
+    Return a Chrome driver for --remote mode, reusing a live session when possible.
+
+    The first run starts chromedriver as a detached process (so it outlives this script),
+    opens a session through webdriver.Remote, and records the URL + session id in
+    REMOTE_STATE_FILE. Later runs reattach to that session, skipping browser startup.
+    A saved session started with a different headless setting is closed and replaced.
+    """
+    url = f"http://127.0.0.1:{REMOTE_PORT}"
+
+    # 1) Try to reattach to the session saved by a previous run.
+    try:
+        with open(REMOTE_STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = None
+
+    if state and _port_open(REMOTE_PORT):
+        class _Reattached(webdriver.Remote):
+            # Remote.__init__ normally creates a brand-new session; adopt the saved one instead.
+            # This relies on Remote.__init__ calling self.start_session(capabilities) last and
+            # on start_session being what sets session_id/caps -- private flow, checked against
+            # the Selenium 4.25.0 source (selenium/webdriver/remote/webdriver.py).
+            def start_session(self, *args, **kwargs):
+                self.session_id = state["session_id"]
+                self.caps = {}
+
+        driver = _Reattached(command_executor=state["url"], options=options)
+        try:
+            driver.current_url  # Cheap round-trip: raises if the session is gone.
+            if state.get("headless") == headless:
+                print("Reattached to running Chrome session.")
+                return driver
+            # Headless/visible mismatch: close the old browser (it holds the remote profile)
+            # and start one that matches this run's options.
+            print("Saved Chrome session has a different headless setting; replacing it.")
+            driver.quit()
+        except Exception:
+            pass  # Browser was closed; fall through and open a new session.
+
+    # 2) Make sure a long-lived chromedriver is listening (start it only if needed).
+    if not _port_open(REMOTE_PORT):
+        subprocess.Popen([driver_path_factory(), f"--port={REMOTE_PORT}"],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         start_new_session=True)  # Detach so it survives this process.
+        deadline = time.monotonic() + 10
+        while not _port_open(REMOTE_PORT):
+            if time.monotonic() > deadline:
+                print("chromedriver did not start listening in time.", file=sys.stderr)
+                sys.exit(4)
+            time.sleep(0.1)
+
+    # 3) Open a fresh session and remember it for the next run. The kept-alive browser gets
+    # its own profile so it never locks the one plain --selenium chrome runs use.
+    # (A temporary fallback profile can't be deleted here: that browser outlives this run.)
+    profile, _ = _profile_dir("chrome_remote")
+    options.add_argument(f"--user-data-dir={profile}")
+    driver = webdriver.Remote(command_executor=url, options=options)
+    with open(REMOTE_STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "session_id": driver.session_id, "headless": headless}, f)
+    return driver
+
+def _browser_list(value: str) -> list:
+    """argparse type: parse "chrome,edge,firefox" into a validated list of browser names."""
+    browsers = [b.strip().lower() for b in value.split(",") if b.strip()]
+    unknown = [b for b in browsers if b not in ("chrome", "edge", "firefox")]
+    if not browsers or unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid browser(s) {', '.join(unknown) or value!r}; use chrome, edge, or firefox")
+    return browsers
+
+def open_with_selenium(browsers, headless: bool, remote: bool = False):
+    """
+    Launch real browsers controlled by Selenium WebDriver. Supports Chrome, Edge, and Firefox.
+    `browsers` is one name, a comma-separated string, or a list; several run in parallel.
     If headless=True, no visible window is shown (useful for automation/CI).
+    If remote=True (Chrome only), reuse a persistent chromedriver + browser session across runs.
 
     We import Selenium and driver-managers inside the function so the module can still be used
     without Selenium installed (e.g., when using only the standard library mode).
@@ -80,110 +363,182 @@ def open_with_selenium(browser: str, headless: bool):
               f"\nOriginal error: {e}", sep="\n", file=sys.stderr)
         sys.exit(2)
 
-    # We'll assign the driver into this variable; initializing to None makes it visible in finally.
-    driver = None
-    try:
-        # Normalize the browser name to simplify comparisons and accept CHROME/Chrome/chrome, etc.
-        browser = browser.lower()
-
-        # ----------------------
-        # Google Chrome branch
-        # ----------------------
-        if browser == "chrome":
-            options = webdriver.ChromeOptions()        # Container for Chrome-specific flags.
-            if headless:
-                # Chrome's modern headless mode with better parity to headed mode.
-                options.add_argument("--headless=new")
-            # Start maximized for friendlier screenshots/visibility (ignored in some headless envs).
-            options.add_argument("--start-maximized")
-            # ChromeDriverManager installs or locates a matching chromedriver binary automatically.
-            driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()),
-                options=options
-            )
-
-        # ------------------
-        # Microsoft Edge
-        # ------------------
-        elif browser == "edge":
-            options = webdriver.EdgeOptions()          # Edge-specific flags.
-            if headless:
-                options.add_argument("--headless=new") # Edge shares Chromium headless semantics.
-            options.add_argument("--start-maximized")
-            driver = webdriver.Edge(
-                service=EdgeService(EdgeChromiumDriverManager().install()),
-                options=options
-            )
-
-        # ----------------------
-        # Mozilla Firefox branch
-        # ----------------------
-        elif browser == "firefox":
-            options = webdriver.FirefoxOptions()       # Firefox-specific flags.
-            if headless:
-                # Firefox uses "-headless" (single dash), different from Chromium.
-                options.add_argument("-headless")
-            driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
-                options=options
-            )
-            # On some platforms, maximize after launch; in headless this can be a no-op/raise.
-            try:
-                driver.maximize_window()
-            except Exception:
-                pass  # It's okay if maximizing fails in virtual/headless environments.
+    # Accept "chrome,edge" as well as a single name; drop duplicates (they'd share a profile).
+    if isinstance(browsers, str):
+        browsers = browsers.split(",")
+    browsers = list(dict.fromkeys(b.strip().lower() for b in browsers if b.strip()))
 
-        else:
-            # Reject anything other than the allowed choices.
-            print(f"Unknown browser '{browser}'. Use chrome, edge, or firefox.", file=sys.stderr)
-            sys.exit(3)
+    def _launch(browser: str):
+        """Build options, start one driver, load the page, and screenshot it."""
+        # We'll assign the driver into this variable; initializing to None makes it visible in finally.
+        driver = None
+        # Set when _profile_dir had to fall back to a temporary profile; removed in finally.
+        temp_profile = None
+        try:
+            # Normalize the browser name to simplify comparisons and accept CHROME/Chrome/chrome, etc.
+            browser = browser.lower()
 
-        # Status print before navigation so users/logs show what's happening.
-        print(f"Launching {browser} and navigating to {URL} ...")
+            # ----------------------
+            # Google Chrome branch
+            # ----------------------
+            if browser == "chrome":
+                options = webdriver.ChromeOptions()        # Container for Chrome-specific flags.
+                if headless:
+                    # Chrome's modern headless mode with better parity to headed mode.
+                    options.add_argument("--headless=new")
+                    # Skip Chromium subsystems a headless page load doesn't need.
+                    for flag in CHROMIUM_HEADLESS_FLAGS:
+                        options.add_argument(flag)
+                # Start maximized for friendlier screenshots/visibility (ignored in some headless envs).
+                options.add_argument("--start-maximized")
+                # Reuse a cached profile instead of creating a fresh one on every launch.
+                # (--remote picks its own profile in _remote_chrome, only when it opens a session.)
+                if not remote:
+                    profile, is_temp = _profile_dir("chrome")
+                    temp_profile = profile if is_temp else None
+                    options.add_argument(f"--user-data-dir={profile}")
+                options.add_argument("--profile-directory=Default")
+                # Record DevTools events so we can wait on Page.loadEventFired after navigating.
+                options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+                if remote:
+                    # Reuse (or start) a long-lived chromedriver and attach to its session.
+                    driver = _remote_chrome(webdriver, options,
+                                            lambda: _driver_path(
+                                                "chrome", ChromeDriverManager().install),
+                                            headless)
+                else:
+                    # ChromeDriverManager installs or locates a matching chromedriver binary automatically.
+                    driver = webdriver.Chrome(
+                        service=ChromeService(
+                            _driver_path("chrome", ChromeDriverManager().install)),
+                        options=options
+                    )
 
-        # Navigate to the target page. This returns once initial navigation completes;
-        # it does not guarantee that all dynamic content finished loading.
-        driver.get(URL)
+            # ------------------
+            # Microsoft Edge
+            # ------------------
+            elif browser == "edge":
+                options = webdriver.EdgeOptions()          # Edge-specific flags.
+                if headless:
+                    options.add_argument("--headless=new") # Edge shares Chromium headless semantics.
+                    for flag in CHROMIUM_HEADLESS_FLAGS:
+                        options.add_argument(flag)
+                options.add_argument("--start-maximized")
+                profile, is_temp = _profile_dir("edge")
+                temp_profile = profile if is_temp else None
+                options.add_argument(f"--user-data-dir={profile}")
+                options.add_argument("--profile-directory=Default")
+                options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+                driver = webdriver.Edge(
+                    service=EdgeService(
+                        _driver_path("edge", EdgeChromiumDriverManager().install)),
+                    options=options
+                )
 
-        # --------------------
-        # Basic "page is up" wait
-        # --------------------
-        # We wait until a <body> element exists. It's a generic, reliable signal that
-        # the DOM was built. For more specific checks, wait on site-specific elements.
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-        except Exception:
-            # If this times out, continue anyway—network blockers or cookie modals can interfere.
-            pass
+            # ----------------------
+            # Mozilla Firefox branch
+            # ----------------------
+            elif browser == "firefox":
+                options = webdriver.FirefoxOptions()       # Firefox-specific flags.
+                if headless:
+                    # Firefox uses "-headless" (single dash), different from Chromium.
+                    options.add_argument("-headless")
+                # Point Firefox at a cached profile so places.sqlite etc. aren't rebuilt each run.
+                profile, is_temp = _profile_dir("ff")
+                temp_profile = profile if is_temp else None
+                options.add_argument("-profile")
+                options.add_argument(profile)
+                driver = webdriver.Firefox(
+                    service=FirefoxService(
+                        _driver_path("firefox", GeckoDriverManager().install)),
+                    options=options
+                )
+                # On some platforms, maximize after launch; in headless this can be a no-op/raise.
+                try:
+                    driver.maximize_window()
+                except Exception:
+                    pass  # It's okay if maximizing fails in virtual/headless environments.
 
-        # Quick sanity check: print the current page title to stdout.
-        print("Page title:", driver.title)
+            else:
+                # Reject anything other than the allowed choices.
+                print(f"Unknown browser '{browser}'. Use chrome, edge, or firefox.", file=sys.stderr)
+                sys.exit(3)
 
-        # ----------------
-        # Optional proof
-        # ----------------
-        # Save a screenshot to confirm visually that we reached the site.
-        screenshot_path = "aiche_home.png"
-        try:
-            driver.save_screenshot(screenshot_path)
-            print(f"Saved screenshot to {screenshot_path}")
-        except Exception:
-            # Not all environments permit screenshots; it's non-fatal.
-            pass
-
-        # If the browser is visible (not headless), keep it open briefly so humans can see it
-        # before the script ends (some automation wrappers would close immediately otherwise).
-        if not headless:
-            print("Leaving the browser open for 5 seconds...")
-            time.sleep(5)
-
-    finally:
-        # Cleanup policy: in headless mode we always quit to avoid orphaned processes.
-        # In visible mode, we intentionally DO NOT quit so the user can interact with the page.
-        if headless and driver is not None:
-            driver.quit()
+            # Status print before navigation so users/logs show what's happening.
+            print(f"Launching {browser} and navigating to {URL} ...")
+
+            # Chrome/Edge: navigate over CDP and continue the moment the load event fires.
+            if not _cdp_navigate(driver, URL):
+                # Navigate to the target page. This returns once initial navigation completes;
+                # it does not guarantee that all dynamic content finished loading.
+                driver.get(URL)
+
+                # --------------------
+                # Basic "page is up" wait
+                # --------------------
+                # We wait until a <body> element exists. It's a generic, reliable signal that
+                # the DOM was built. For more specific checks, wait on site-specific elements.
+                try:
+                    WebDriverWait(driver, 20).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+                except Exception:
+                    # If this times out, continue anyway—network blockers or cookie modals can interfere.
+                    pass
+
+            # Quick sanity check: print the current page title to stdout.
+            print(f"[{browser}] Page title:", driver.title)
+
+            # ----------------
+            # Optional proof
+            # ----------------
+            # Save a screenshot to confirm visually that we reached the site.
+            # (one file per browser when several run at once, so they don't overwrite each other)
+            screenshot_path = "aiche_home.png" if len(browsers) == 1 else f"aiche_home_{browser}.png"
+            try:
+                driver.save_screenshot(screenshot_path)
+                print(f"Saved screenshot to {screenshot_path}")
+            except Exception:
+                # Not all environments permit screenshots; it's non-fatal.
+                pass
+
+            # If the browser is visible (not headless), keep it open briefly so humans can see it
+            # before the script ends (some automation wrappers would close immediately otherwise).
+            if not headless:
+                print("Leaving the browser open for 5 seconds...")
+                time.sleep(5)
+
+        finally:
+            # Cleanup policy: in headless mode we always quit to avoid orphaned processes.
+            # In visible mode, we intentionally DO NOT quit so the user can interact with the page.
+            # In remote mode, we never quit: the session is kept alive for the next run to reuse.
+            if headless and not remote and driver is not None:
+                driver.quit()
+                driver = None
+            # Delete a temporary fallback profile once no browser is using it (also when the
+            # launch failed). A visible browser we leave open keeps its temp profile.
+            if temp_profile and driver is None:
+                shutil.rmtree(temp_profile, ignore_errors=True)
+
+    # A single browser runs inline, exactly as before.
+    if len(browsers) == 1:
+        _launch(browsers[0])
+        return
+
+    # Several browsers: launch them concurrently so wall-clock time is roughly the slowest
+    # launch rather than the sum. Each thread owns its own driver, port, and profile dir.
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(browsers)) as pool:
+        futures = {pool.submit(_launch, b): b for b in browsers}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (Exception, SystemExit) as e:
+                # One browser failing shouldn't hide the results from the others.
+                print(f"[{futures[future]}] failed: {e!r}", file=sys.stderr)
+                failed = True
+    if failed:
+        sys.exit(1)
 
 def main():
     """
@@ -194,21 +549,27 @@ def main():
     # Create a parser with a helpful description shown in -h/--help.
     parser = argparse.ArgumentParser(description="Open a navigator and access aiche.com")
 
-    # Optional flag to choose Selenium and select which browser to automate.
-    # argparse enforces the allowed choices and shows them in the help text.
-    parser.add_argument("--selenium", choices=["chrome", "edge", "firefox"],
-                        help="Use Selenium to automate a specific browser")
+    # Optional flag to choose Selenium and select which browser(s) to automate.
+    # _browser_list validates a comma-separated list, e.g. "chrome,firefox".
+    parser.add_argument("--selenium", type=_browser_list, metavar="chrome,edge,firefox",
+                        help="Use Selenium to automate one or more browsers (comma-separated)")
 
     # Boolean flag; if present, it's True (default False). Only meaningful with --selenium.
     parser.add_argument("--headless", action="store_true",
                         help="Run the Selenium browser without a visible window")
 
+    # Boolean flag; keep chromedriver + the browser alive and reattach on later runs.
+    parser.add_argument("--remote", action="store_true",
+                        help="Reuse a persistent chromedriver session across runs (chrome only)")
+
     # Parse the flags from sys.argv.
     args = parser.parse_args()
+    if args.remote and args.selenium != ["chrome"]:
+        parser.error("--remote is only supported with --selenium chrome")
 
     # If --selenium was provided, run the automated path; otherwise, use the simple webbrowser path.
     if args.selenium:
-        open_with_selenium(args.selenium, args.headless)
+        open_with_selenium(args.selenium, args.headless, args.remote)
     else:
         open_with_webbrowser()
 
@@ -5,12 +5,22 @@
 # - List items
 # - Query an item's price
 # - Persistent storage in catalog.json (JSON file)
+# - Edits are appended to catalog.log and folded into catalog.json on exit
+# - Piped (non-tty) stdin runs the same commands in batch mode, saving once at EOF
 
 import json
+import operator
 import os
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, BinaryIO, Optional
+
+try:
+    import orjson  # optional: much faster JSON encode/decode (pip install orjson)
+except ImportError:
+    orjson = None
 
 CATALOG_FILE = "catalog.json"
+LOG_FILE = "catalog.log"
 
 
 def _normalize_key(name: str) -> str:
@@ -23,11 +33,16 @@ def load_catalog(filename: str = CATALOG_FILE) -> Dict[str, Dict[str, Any]]:
     if not os.path.exists(filename):
         return {}
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Ensure expected shape
+        if orjson is not None:
+            with open(filename, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        # Ensure expected shape; re-key by normalized name so lookups
+        # and sorting never need to casefold again
         if isinstance(data, dict):
-            return data
+            return {_normalize_key(k): v for k, v in data.items()}
     except Exception:
         pass
     return {}
@@ -35,27 +50,67 @@ def load_catalog(filename: str = CATALOG_FILE) -> Dict[str, Dict[str, Any]]:
 
 def save_catalog(catalog: Dict[str, Dict[str, Any]], filename: str = CATALOG_FILE) -> None:
     """Save the catalog JSON with pretty formatting."""
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(catalog, option=orjson.OPT_INDENT_2))
+        return
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(catalog, f, indent=2, ensure_ascii=False)
 
 
-def add_item(catalog: Dict[str, Dict[str, Any]], name: str, price: float) -> None:
+def _append_log(log: Optional[BinaryIO], record: Dict[str, Any]) -> None:
+    """Append one change record as a JSON line (no-op without a log)."""
+    if log is None:
+        return
+    if orjson is not None:
+        log.write(orjson.dumps(record) + b"\n")
+    else:
+        log.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+    log.flush()
+
+
+def replay_log(catalog: Dict[str, Dict[str, Any]], filename: str = LOG_FILE) -> None:
+    """Apply change records from the log on top of a loaded catalog."""
+    if not os.path.exists(filename):
+        return
+    with open(filename, "rb") as f:
+        for line in f:
+            try:
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+                if record["op"] == "set":
+                    catalog[record["k"]] = record["v"]
+                elif record["op"] == "del":
+                    catalog.pop(record["k"], None)
+            except Exception:
+                # Skip a torn/invalid line (e.g. interrupted write)
+                continue
+
+
+def add_item(catalog: Dict[str, Dict[str, Any]], name: str, price: float,
+             log: Optional[BinaryIO] = None) -> None:
     """Add a new item or overwrite if it exists."""
     key = _normalize_key(name)
     catalog[key] = {"name": name.strip(), "price": float(price)}
+    _append_log(log, {"op": "set", "k": key, "v": catalog[key]})
 
 
-def remove_item(catalog: Dict[str, Dict[str, Any]], name: str) -> bool:
+def remove_item(catalog: Dict[str, Dict[str, Any]], name: str,
+                log: Optional[BinaryIO] = None) -> bool:
     """Remove an item by name (case-insensitive). Returns True if removed."""
     key = _normalize_key(name)
-    return catalog.pop(key, None) is not None
+    if catalog.pop(key, None) is None:
+        return False
+    _append_log(log, {"op": "del", "k": key})
+    return True
 
 
-def update_price(catalog: Dict[str, Dict[str, Any]], name: str, price: float) -> bool:
+def update_price(catalog: Dict[str, Dict[str, Any]], name: str, price: float,
+                 log: Optional[BinaryIO] = None) -> bool:
     """Update price of an existing item. Returns True if updated."""
     key = _normalize_key(name)
     if key in catalog:
         catalog[key]["price"] = float(price)
+        _append_log(log, {"op": "set", "k": key, "v": catalog[key]})
         return True
     return False
 
@@ -72,76 +127,111 @@ def list_items(catalog: Dict[str, Dict[str, Any]]) -> None:
     if not catalog:
         print("Catalog is empty.")
         return
-    items = sorted(catalog.values(), key=lambda x: x["name"].casefold())
+    # Keys are already normalized (casefolded) names, so sort on them directly
+    items = sorted(catalog.items(), key=operator.itemgetter(0))
     print("\nCurrent Catalog")
     print("-" * 40)
-    for it in items:
+    for _, it in items:
         print(f"{it['name']:<20} ${it['price']:.2f}")
     print("-" * 40)
 
 
-def menu() -> None:
-    catalog = load_catalog()
-    while True:
-        print(
-            "\n=== Supermarket Cashier Register ===\n"
-            "1) List items\n"
-            "2) Add item\n"
-            "3) Remove item\n"
-            "4) Update price\n"
-            "5) Get price\n"
-            "6) Save & Exit\n"
-        )
-        choice = input("Choose an option (1-6): ").strip()
-
-        if choice == "1":
-            list_items(catalog)
-
-        elif choice == "2":
-            name = input("Enter item name to add: ").strip()
-            try:
-                price = float(input("Enter price: ").strip())
-            except ValueError:
-                print("Invalid price. Please enter a number.")
-                continue
-            add_item(catalog, name, price)
-            print(f"Added/updated '{name}' at ${price:.2f}.")
+def _run_menu(catalog: Dict[str, Dict[str, Any]], read, log: Optional[BinaryIO],
+              interactive: bool) -> None:
+    """Run menu commands until Save & Exit or end of input, then save once.
 
-        elif choice == "3":
-            name = input("Enter item name to remove: ").strip()
-            if remove_item(catalog, name):
-                print(f"Removed '{name}'.")
-            else:
-                print(f"'{name}' not found.")
+    read(prompt) returns the next input line and raises EOFError when input runs out.
+    The menu banner is shown only when interactive; edits go to the change log if given.
+    """
+    try:
+        while True:
+            if interactive:
+                print(
+                    "\n=== Supermarket Cashier Register ===\n"
+                    "1) List items\n"
+                    "2) Add item\n"
+                    "3) Remove item\n"
+                    "4) Update price\n"
+                    "5) Get price\n"
+                    "6) Save & Exit\n"
+                )
+            choice = read("Choose an option (1-6): ").strip()
+
+            if choice == "1":
+                list_items(catalog)
+
+            elif choice == "2":
+                name = read("Enter item name to add: ").strip()
+                try:
+                    price = float(read("Enter price: ").strip())
+                except ValueError:
+                    print("Invalid price. Please enter a number.")
+                    continue
+                add_item(catalog, name, price, log)
+                print(f"Added/updated '{name}' at ${price:.2f}.")
+
+            elif choice == "3":
+                name = read("Enter item name to remove: ").strip()
+                if remove_item(catalog, name, log):
+                    print(f"Removed '{name}'.")
+                else:
+                    print(f"'{name}' not found.")
+
+            elif choice == "4":
+                name = read("Enter item name to update: ").strip()
+                try:
+                    price = float(read("Enter new price: ").strip())
+                except ValueError:
+                    print("Invalid price. Please enter a number.")
+                    continue
+                if update_price(catalog, name, price, log):
+                    print(f"Updated '{name}' to ${price:.2f}.")
+                else:
+                    print(f"'{name}' not found. Use 'Add item' instead.")
+
+            elif choice == "5":
+                name = read("Enter item name to look up: ").strip()
+                price = get_price(catalog, name)
+                if price is None:
+                    print(f"'{name}' not found.")
+                else:
+                    print(f"The price of {name} is ${price:.2f}.")
+
+            elif choice == "6":
+                break
 
-        elif choice == "4":
-            name = input("Enter item name to update: ").strip()
-            try:
-                price = float(input("Enter new price: ").strip())
-            except ValueError:
-                print("Invalid price. Please enter a number.")
-                continue
-            if update_price(catalog, name, price):
-                print(f"Updated '{name}' to ${price:.2f}.")
             else:
-                print(f"'{name}' not found. Use 'Add item' instead.")
+                print("Invalid option. Please choose 1-6.")
+    except EOFError:
+        pass  # End of input behaves like Save & Exit
 
-        elif choice == "5":
-            name = input("Enter item name to look up: ").strip()
-            price = get_price(catalog, name)
-            if price is None:
-                print(f"'{name}' not found.")
-            else:
-                print(f"The price of {name} is ${price:.2f}.")
+    # Compact: fold all edits (logged or replayed) into the JSON file once
+    save_catalog(catalog)
+    if log is not None:
+        log.truncate(0)
+    elif os.path.exists(LOG_FILE):
+        open(LOG_FILE, "wb").close()
+    print(f"Saved to {CATALOG_FILE}. Goodbye!")
 
-        elif choice == "6":
-            save_catalog(catalog)
-            print(f"Saved to {CATALOG_FILE}. Goodbye!")
-            break
 
-        else:
-            print("Invalid option. Please choose 1-6.")
+def menu() -> None:
+    catalog = load_catalog()
+    replay_log(catalog)
+    # Piped input: read every command at once; no prompts or per-edit log, one save at EOF
+    if not sys.stdin.isatty():
+        lines = iter(sys.stdin.read().splitlines())
 
+        def read(_prompt: str) -> str:
+            try:
+                return next(lines)
+            except StopIteration:
+                raise EOFError from None
+
+        _run_menu(catalog, read, None, interactive=False)
+        return
+    # Each edit appends one line here instead of rewriting the whole catalog
+    with open(LOG_FILE, "ab") as log:
+        _run_menu(catalog, input, log, interactive=True)
 
 if __name__ == "__main__":
     menu()
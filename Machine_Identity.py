@@ -1,7 +1,16 @@
 import platform
 import socket
+import struct
 import psutil
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+def _safe_usage(mountpoint):
+    # Return disk usage for a mountpoint, or None if it can't be read
+    try:
+        return psutil.disk_usage(mountpoint)
+    except OSError:  # includes PermissionError
+        return None
 
 def get_system_info():
     # Get hostname and IP
@@ -11,17 +20,22 @@ def get_system_info():
     except socket.gaierror:
         ip_address = "Unable to retrieve IP"
 
+    # One uname() call instead of separate platform.* lookups
+    uname = platform.uname()
+    # Pointer size gives 32/64-bit directly (platform.architecture() may inspect the binary)
+    bits = struct.calcsize("P") * 8
+
     print("========== System Information ==========")
     print(f"Hostname: {hostname}")
     print(f"IP Address: {ip_address}")
-    print(f"System: {platform.system()}")
-    print(f"Machine Type: {platform.machine()}")
-    print(f"Processor: {platform.processor()}")
+    print(f"System: {uname.system}")
+    print(f"Machine Type: {uname.machine}")
+    print(f"Processor: {uname.processor}")
     print(f"CPU Cores (Physical): {psutil.cpu_count(logical=False)}")
     print(f"CPU Threads (Logical): {psutil.cpu_count(logical=True)}")
-    print(f"OS Version: {platform.version()}")
-    print(f"OS Release: {platform.release()}")
-    print(f"Architecture: {platform.architecture()[0]}")
+    print(f"OS Version: {uname.version}")
+    print(f"OS Release: {uname.release}")
+    print(f"Architecture: {bits}bit")
     print(f"Python Version: {platform.python_version()}")
 
     # RAM info
@@ -34,18 +48,21 @@ def get_system_info():
 
     # Disk info
     print("\n========== Disk Information ==========")
-    for partition in psutil.disk_partitions():
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            print(f"Drive: {partition.device}")
-            print(f"  Mountpoint: {partition.mountpoint}")
-            print(f"  File system: {partition.fstype}")
-            print(f"  Total Size: {usage.total / (1024 ** 3):.2f} GB")
-            print(f"  Used: {usage.used / (1024 ** 3):.2f} GB")
-            print(f"  Free: {usage.free / (1024 ** 3):.2f} GB")
-            print(f"  Usage: {usage.percent}%")
-        except PermissionError:
+    partitions = psutil.disk_partitions(all=False)
+    # Query all mounts at once; slow (sleeping/network) drives no longer add up
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(partitions)))) as ex:
+        usages = list(ex.map(lambda p: (p, _safe_usage(p.mountpoint)), partitions))
+
+    for partition, usage in usages:
+        if usage is None:
             continue
+        print(f"Drive: {partition.device}")
+        print(f"  Mountpoint: {partition.mountpoint}")
+        print(f"  File system: {partition.fstype}")
+        print(f"  Total Size: {usage.total / (1024 ** 3):.2f} GB")
+        print(f"  Used: {usage.used / (1024 ** 3):.2f} GB")
+        print(f"  Free: {usage.free / (1024 ** 3):.2f} GB")
+        print(f"  Usage: {usage.percent}%")
 
     print("\n========================================")
 
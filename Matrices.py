@@ -1,23 +1,18 @@
 import numpy as np
 
-# --- Step 1: Create a 4x4 matrix as a list of lists ---
-matrix_list = [
-    [1, 2, 3, 4],
-    [5, 6, 7, 8],
-    [9, 10, 11, 12],
-    [13, 14, 15, 16]
-]
+# --- Step 1: Create a 4x4 matrix directly as a NumPy array (1..16) ---
+matrix_array = np.arange(1, 17, dtype=np.int64).reshape(4, 4)
 print("Original matrix (list):")
-for row in matrix_list:
+for row in matrix_array.tolist():
     print(row)
 
-# --- Step 2: Convert list to NumPy array ---
-matrix_array = np.array(matrix_list)
+# --- Step 2: Show it as a NumPy array ---
 print("\nMatrix as NumPy array:")
 print(matrix_array)
 
 # --- Step 3: Perform some operation (example: transpose) ---
-transposed = matrix_array.T
+# .T is only a strided view; copy to contiguous memory for fast downstream use
+transposed = np.ascontiguousarray(matrix_array.T)
 print("\nTransposed matrix:")
 print(transposed)
 
@@ -1,8 +1,96 @@
-# terminal: pip install pyautogui pillow
+# terminal: pip install mss pyautogui   (Windows needs neither)
 
-import pyautogui as pag
+import ctypes
+import ctypes.util
+import sys
 import tkinter as tk
 
+# ----- Cursor + pixel readers (native calls, set up once) -----
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+    _user32.GetDC.restype = wintypes.HDC            # handles are pointer-sized on 64-bit
+    _gdi32.GetPixel.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int)
+    _gdi32.GetPixel.restype = wintypes.DWORD
+    _user32.GetCursorPos.argtypes = (ctypes.POINTER(wintypes.POINT),)
+    _user32.GetCursorPos.restype = wintypes.BOOL
+    # Per-monitor DPI aware, so GetCursorPos and GetPixel both use physical pixels
+    # (pyautogui/mss used to set this on import; without it coords are scaled at 125%+)
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)
+    except (AttributeError, OSError):
+        try:
+            _user32.SetProcessDPIAware()            # pre-Windows 8.1 fallback
+        except (AttributeError, OSError):
+            pass
+    _hdc = _user32.GetDC(None)                      # whole-screen DC, kept open
+    CLR_INVALID = 0xFFFFFFFF                        # GetPixel: point outside the DC
+    _last = [0, 0, 0, 0, 0]                         # last good (x, y, r, g, b)
+
+    def read_pixel():
+        # GetCursorPos + GetPixel: two Win32 calls, no screenshot at all
+        p = wintypes.POINT()
+        if not _user32.GetCursorPos(ctypes.byref(p)):
+            return tuple(_last)                     # e.g. secure desktop: keep last reading
+        c = _gdi32.GetPixel(_hdc, p.x, p.y)         # COLORREF = 0x00BBGGRR
+        if c == CLR_INVALID:
+            # Off the screen DC (e.g. monitor at negative coords): keep the previous colour
+            _last[0:2] = p.x, p.y
+        else:
+            _last[:] = p.x, p.y, c & 0xFF, (c >> 8) & 0xFF, (c >> 16) & 0xFF
+        return tuple(_last)
+
+else:
+    import mss
+
+    # one persistent screen-capture handle, reused every frame
+    _sct = mss.mss()
+
+    # X11: ask the server for the pointer directly with XQueryPointer
+    _x11_path = ctypes.util.find_library("X11")
+    _x11 = ctypes.cdll.LoadLibrary(_x11_path) if _x11_path else None
+    _dpy = None
+    if _x11 is not None:
+        _x11.XOpenDisplay.argtypes = (ctypes.c_char_p,)
+        _x11.XOpenDisplay.restype = ctypes.c_void_p
+        _x11.XDefaultRootWindow.argtypes = (ctypes.c_void_p,)
+        _x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        _x11.XQueryPointer.argtypes = (
+            ctypes.c_void_p, ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_uint),
+        )
+        _dpy = _x11.XOpenDisplay(None)
+
+    if _dpy:
+        _root_win = _x11.XDefaultRootWindow(_dpy)
+
+        def cursor_pos():
+            root_ret, child = ctypes.c_ulong(), ctypes.c_ulong()
+            x, y = ctypes.c_int(), ctypes.c_int()
+            wx, wy, mask = ctypes.c_int(), ctypes.c_int(), ctypes.c_uint()
+            _x11.XQueryPointer(_dpy, _root_win, ctypes.byref(root_ret), ctypes.byref(child),
+                               ctypes.byref(x), ctypes.byref(y),
+                               ctypes.byref(wx), ctypes.byref(wy), ctypes.byref(mask))
+            return x.value, y.value
+    else:
+        # macOS / no X11 display: fall back to pyautogui for the position
+        import pyautogui as pag
+
+        def cursor_pos():
+            return pag.position()
+
+    def read_pixel():
+        x, y = cursor_pos()
+        # grab just the 1×1 region under the cursor (raw bytes are BGRA)
+        px = _sct.grab({"left": x, "top": y, "width": 1, "height": 1})
+        b, g, r, _ = px.raw[:4]
+        return x, y, r, g, b
+
 # ----- Tk window -----
 root = tk.Tk()
 root.title("Pixel Color")
@@ -30,15 +118,8 @@ def copy_hex(event=None):
 current_hex = ["#000000"]
 
 def update():
-    # current mouse position
-    x, y = pag.position()
-
-    # try fast per-pixel call; fall back to 1×1 screenshot if needed
-    try:
-        r, g, b = pag.pixel(x, y)
-    except Exception:
-        im = pag.screenshot(region=(x, y, 1, 1))
-        r, g, b = im.getpixel((0, 0))
+    # current mouse position and the color under it
+    x, y, r, g, b = read_pixel()
 
     hx = to_hex(r, g, b)
     current_hex[0] = hx
@@ -48,7 +129,8 @@ def update():
     color_swatch.create_rectangle(0, 0, 80, 80, fill=hx, outline="")
     txt.set(f"Pos: ({x:4d}, {y:4d})  RGB: ({r:3d}, {g:3d}, {b:3d})  HEX: {hx}")
 
-    root.after(50, update)  # ~20 FPS
+    # ~20 FPS; run once Tk is idle so redraws aren't starved
+    root.after(50, root.after_idle, update)
 
 def on_key(event):
     if event.char.lower() == "q":
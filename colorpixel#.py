@@ -1,8 +1,48 @@
-# pip install pillow numpy
-from PIL import ImageGrab
+# pip install mss numpy   (optional: pip install pyspng for faster PNG saves)
+import mss
+import mss.tools
 import numpy as np
 from datetime import datetime
 
+try:
+    import pyspng  # C PNG encoder, much faster than zlib-in-Python for big frames
+except ImportError:
+    pyspng = None
+
+numba = None          # optional, imported on first tolerance > 0 call (pip install numba)
+_count_white = None   # compiled kernel; False once we know numba isn't installed
+
+def _count_white_loop(px, thr):
+    # One streaming pass over the first 3 channels; rows split across threads
+    h, w = px.shape[0], px.shape[1]
+    total = 0
+    for i in numba.prange(h):
+        row = 0
+        for j in range(w):
+            if px[i, j, 0] >= thr and px[i, j, 1] >= thr and px[i, j, 2] >= thr:
+                row += 1
+        total += row
+    return total
+
+def _white_kernel():
+    """Return the Numba tolerance kernel (built once), or None if numba is missing."""
+    global numba, _count_white
+    if _count_white is None:
+        try:
+            import numba
+        except ImportError:
+            _count_white = False
+        else:
+            _count_white = numba.njit(parallel=True, cache=True)(_count_white_loop)
+    return _count_white or None
+
+# Bytes (255, 255, 255, 0) read as one uint32: selects the 3 colour bytes of a
+# BGRA pixel regardless of byte order (alpha/padding may not be 255 on X11)
+_COLOR_MASK = np.array([255, 255, 255, 0], dtype=np.uint8).view(np.uint32)[0]
+
+# Reuse one capture handle (X11/GDI/Quartz) across calls
+sct = mss.mss()
+
 def count_white_pixels(tolerance: int = 0, save_png: bool = True) -> None:
     """
     Take a screenshot, count white (or nearly white) pixels, and print a summary.
@@ -11,27 +51,40 @@ def count_white_pixels(tolerance: int = 0, save_png: bool = True) -> None:
                e.g., 10 counts pixels with R,G,B >= 245 as white.
     save_png : save the screenshot as a PNG with a timestamped filename.
     """
-    # Grab the whole screen
-    img = ImageGrab.grab()  # works on Windows/macOS/Linux (with X11)
-    arr = np.asarray(img)
+    # Grab the primary screen (monitors[0] would be the bounding box of all monitors)
+    shot = sct.grab(sct.monitors[1])  # works on Windows/macOS/Linux (with X11)
+    # Wrap the raw BGRA buffer without copying it (shot.bgra would make a bytes copy)
+    arr = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
 
-    # Drop alpha channel if present
-    rgb = arr[..., :3]
+    h, w = arr.shape[:2]
 
-    # Build mask for white (or near white) pixels
+    # Count white (or near white) pixels (channel order doesn't matter for white)
     if tolerance <= 0:
-        white_mask = np.all(rgb == 255, axis=2)
+        # Compare whole BGRA pixels as aligned uint32s, masking out alpha (no copy)
+        packed = arr.view(np.uint32).reshape(h, w)
+        white_pixels = int(np.count_nonzero((packed & _COLOR_MASK) == _COLOR_MASK))
     else:
         thr = 255 - int(tolerance)
-        white_mask = np.all(rgb >= thr, axis=2)
+        kernel = _white_kernel()
+        if kernel is not None:
+            # Numba kernel reads the BGRA buffer directly, ignoring alpha
+            white_pixels = int(kernel(arr, thr))
+        else:
+            # min(R, G, B) >= thr is the same as R, G and B all >= thr
+            white_pixels = int(np.count_nonzero(np.minimum.reduce(arr[..., :3], axis=2) >= thr))
 
-    white_pixels = int(white_mask.sum())
-    total_pixels = int(rgb.shape[0] * rgb.shape[1])
+    total_pixels = int(h * w)
     pct = 100.0 * white_pixels / total_pixels
 
     if save_png:
         fname = f"screenshot_{datetime.now():%Y%m%d_%H%M%S}.png"
-        img.save(fname)
+        # Diagnostic file: favor speed over size (compression level 1)
+        if pyspng is not None:
+            rgb_img = np.frombuffer(shot.rgb, dtype=np.uint8).reshape(shot.height, shot.width, 3)
+            with open(fname, "wb") as f:
+                f.write(pyspng.encode(rgb_img, compress_level=1))
+        else:
+            mss.tools.to_png(shot.rgb, shot.size, level=1, output=fname)
 
     print(f"White pixels: {white_pixels:,} / {total_pixels:,} "
           f"({pct:.2f}%)  | tolerance={tolerance}")
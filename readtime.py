@@ -2,7 +2,8 @@
 """
 Live network time display.
 
-- Fetches the current time from worldtimeapi.org (based on your IP/region).
+- Fetches the current time with a single SNTP packet (pool.ntp.org, UDP 123),
+  falling back to worldtimeapi.org over HTTPS if NTP is unreachable.
 - Keeps a smoothly updated clock by advancing from a monotonic timer.
 - Re-syncs from the internet every few minutes when online.
 - Falls back to the local system clock until the network is back.
@@ -10,17 +11,64 @@ Live network time display.
 Requires: requests  (pip install requests)
 """
 
+import socket
+import struct
 import time
 from datetime import datetime, timedelta, timezone
 import requests
+from requests.adapters import HTTPAdapter
 
-API_URL = "https://worldtimeapi.org/api/ip"   # public, no auth
+API_URL = "https://worldtimeapi.org/api/ip"   # public, no auth (fallback only)
+NTP_SERVER = "pool.ntp.org"                   # public SNTP pool
+NTP_PORT = 123
+NTP_EPOCH_DELTA = 2208988800                  # seconds from 1900-01-01 (NTP) to 1970-01-01 (Unix)
 SYNC_EVERY_SEC = 300                          # re-sync interval (5 minutes)
-TIMEOUT_SEC = 4                               # HTTP timeout
+TIMEOUT_SEC = 4                               # network timeout
+
+# One keep-alive session: later syncs reuse the pooled TCP socket and TLS session
+_session = requests.Session()
+_session.headers["User-Agent"] = "nyu-chemecar/1.0"
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+def get_ntp_offset():
+    """Return (server clock - local clock) in seconds from one SNTP query (or raise)."""
+    packet = bytearray(48)
+    packet[0] = 0x1B  # LI=0, version 3, mode 3 (client)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(TIMEOUT_SEC)
+        t1 = time.time()
+        sock.sendto(packet, (NTP_SERVER, NTP_PORT))
+        data, _ = sock.recvfrom(48)
+        t4 = time.time()
+    if len(data) < 48:
+        raise ValueError("Short NTP reply")
+    # Reject unusable replies so the caller falls back to the web:
+    # mode must be 4 (server), stratum 0 is a kiss-o'-death, and a zero transmit time is unset
+    if data[0] & 7 != 4 or data[1] == 0 or data[40:48] == bytes(8):
+        raise ValueError("Invalid NTP reply")
+
+    def ntp_to_unix(offset):
+        # 64-bit NTP timestamp: 32-bit seconds + 32-bit fraction
+        secs, frac = struct.unpack("!II", data[offset:offset + 8])
+        return secs - NTP_EPOCH_DELTA + frac / 2**32
+
+    t2 = ntp_to_unix(32)  # server receive time
+    t3 = ntp_to_unix(40)  # server transmit time
+    return ((t2 - t1) + (t3 - t4)) / 2
 
 def get_network_time():
+    """Return a timezone-aware datetime from NTP, or from the web (or raise)."""
+    try:
+        offset = get_ntp_offset()
+    except Exception:
+        return get_web_time()
+    # NTP carries no timezone; present the corrected time in the local zone
+    net_dt = datetime.fromtimestamp(time.time() + offset).astimezone()
+    return net_dt, net_dt.tzname()
+
+def get_web_time():
     """Return a timezone-aware datetime from the web (or raise)."""
-    r = requests.get(API_URL, timeout=TIMEOUT_SEC)
+    r = _session.get(API_URL, timeout=TIMEOUT_SEC)
     r.raise_for_status()
     data = r.json()
 
@@ -73,11 +121,13 @@ def main():
                     # Keep running; try again next interval
                     last_sync = now_mono  # avoid tight retry loop
 
-            # Pretty print in place
-            display = current_dt.strftime("%Y-%m-%d %H:%M:%S")
+            # Pretty print in place (direct field formatting skips strftime's locale/tz work)
+            display = (f"{current_dt.year:04d}-{current_dt.month:02d}-{current_dt.day:02d} "
+                       f"{current_dt.hour:02d}:{current_dt.minute:02d}:{current_dt.second:02d}")
             tz_disp = tz_name
             print(f"\r{display}  ({tz_disp})", end="", flush=True)
-            time.sleep(0.25)
+            # Seconds only change once per second: sleep until the displayed clock ticks
+            time.sleep(1.0 - current_dt.microsecond / 1_000_000)
     except KeyboardInterrupt:
         print("\nBye!")
 